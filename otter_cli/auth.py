@@ -3,28 +3,267 @@ Authentication module for Otter.ai API
 Handles login and basic API operations with proper error handling
 """
 
+import functools
 import logging
-import json
-from typing import List, Dict, Optional, Any
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple, TypedDict
+
+from . import cache
+
+if TYPE_CHECKING:
+    from otterai import OtterAI
 
-# Set up detailed logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 try:
-    from otterai import OtterAI, OtterAIException
+    import orjson
 except ImportError:
-    # Fallback if otterai is not installed
-    print("⚠️  otterai package not found. Please install with: pip install -r requirements.txt")
-    raise
+    # Optional speedup (pip install orjson); stdlib json is the fallback
+    orjson = None
+
+# otterai drags in the whole requests/urllib3 stack, which commands like
+# --help never need, so it is imported on first login instead of here
+_otterai = None
+
+
+def _load_otterai():
+    """Import otterai on first use and return the module"""
+    global _otterai
+    if _otterai is None:
+        try:
+            import otterai
+        except ImportError:
+            # Fallback if otterai is not installed
+            print("⚠️  otterai package not found. Please install with: pip install -r requirements.txt")
+            raise
+        _otterai = otterai
+    return _otterai
+
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 20
+
+SPEECHES_URL = 'https://otter.ai/forward/api/v1/speeches'
+
+# bulk_export options tuned for LLM-friendly plain-text transcripts
+EXPORT_OPTIONS = {
+    'speaker_names': 1,  # Include speaker names
+    'speaker_timestamps': 0,  # NO timestamps (better for LLM)
+    'merge_same_speaker_segments': 1,  # Combine same speaker paragraphs
+    'show_highlights': 0,  # No highlights
+    'inline_pictures': 0,
+    'monologue': 0,
+    'highlight_only': 0,
+    'branding': 'false',
+    'annotations': 0
+}
+
+# Page size used when walking the whole library
+LIST_PAGE_SIZE = 500
+
+# Retry policy for transient API failures (rate limiting, server hiccups)
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_ATTEMPTS = 6
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+
+# Retries handled inside the connection pool, for bulk_export POSTs only (failed
+# connects and retryable statuses); every other call already goes through _retry
+ADAPTER_RETRIES = 3
+ADAPTER_BACKOFF_FACTOR = 0.3
+
+# Set OTTER_CLI_TRACE=1 to log full API payloads instead of their shape
+TRACE = os.environ.get('OTTER_CLI_TRACE') == '1'
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(content)
+    import json
+    
+    return json.loads(content)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a decoded response for trace logging, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode('utf-8')
+    import json
+    
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _shape(obj: Any, depth: int = 2) -> Any:
+    """
+    Summarise a decoded API response for debug logging without its content
+    
+    e.g. {'status': 'int', 'data': {'speeches': 'list[500]', 'end_of_list': 'bool'}}
+    """
+    if isinstance(obj, dict):
+        if depth <= 0:
+            return f"dict[{len(obj)}]"
+        return {key: _shape(value, depth - 1) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return f"{type(obj).__name__}[{len(obj)}]"
+    return type(obj).__name__
+
+
+def _response_status(result: Any) -> Optional[int]:
+    """Status code of a requests.Response or an otterai {'status': ..., 'data': ...} dict"""
+    if hasattr(result, 'status_code'):
+        return result.status_code
+    if isinstance(result, dict):
+        return result.get('status')
+    return None
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether an exception is worth retrying"""
+    import requests
+    
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, _load_otterai().OtterAIException):
+        return any(str(code) in str(error) for code in RETRYABLE_STATUS_CODES)
+    return False
+
+
+def _retry(call: Callable[[], Any], description: str) -> Any:
+    """
+    Run an API call, retrying transient failures with jittered exponential backoff
+    
+    Retries connection errors and 429/5xx responses. Anything else (including
+    401 Unauthorized) is returned or raised immediately - retrying won't fix it.
+    
+    Args:
+        call: Zero-argument callable performing the request
+        description: What the call does, for log messages
+        
+    Returns:
+        Whatever the call returns (the last response if retries run out)
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            result = call()
+        except Exception as e:
+            if attempt == MAX_ATTEMPTS or not _is_transient(e):
+                raise
+            reason = str(e)
+        else:
+            status = _response_status(result)
+            if attempt == MAX_ATTEMPTS or status not in RETRYABLE_STATUS_CODES:
+                return result
+            reason = f"HTTP {status}"
+        
+        delay = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+        logger.warning("⏳ %s failed (%s), retrying in %.1fs (attempt %d/%d)", description, reason, delay, attempt, MAX_ATTEMPTS)
+        time.sleep(delay)
+
+
+def _unseen(speeches: Iterable[Dict[str, Any]], seen_ids: Set[str]) -> List[Dict[str, Any]]:
+    """
+    Drop speeches already returned by an earlier page, recording new IDs in seen_ids
+    
+    Speeches without an otid/id can't be compared and are always kept.
+    """
+    fresh = []
+    for speech in speeches:
+        speech_key = speech.get('otid') or speech.get('id')
+        if speech_key:
+            if speech_key in seen_ids:
+                continue
+            seen_ids.add(speech_key)
+        fresh.append(speech)
+    return fresh
+
+
+class OtterAuthError(Exception):
+    """Base class for errors raised by OtterAuth; the underlying error is chained as __cause__"""
+
+
+class NotAuthenticatedError(OtterAuthError):
+    """Raised when an API method is called before a successful login"""
+
+
+def require_auth(method: Callable) -> Callable:
+    """Decorator for OtterAuth methods that need a logged-in session"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.authenticated or self.otter is None:
+            raise NotAuthenticatedError("Not authenticated. Please login first.")
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class SpeechesData(TypedDict, total=False):
+    """Body of the speeches endpoint"""
+    speeches: List[Dict[str, Any]]
+    end_of_list: bool
+    last_load_ts: int
+    last_modified_at: int
+
+
+class SpeechesResponse(TypedDict):
+    """otterai's {'status': ..., 'data': ...} wrapper around an API response"""
+    status: int
+    data: SpeechesData
+
+
+class SpeechPage(NamedTuple):
+    """One page of the speeches endpoint, plus the cursors for the next page"""
+    speeches: Tuple[Dict[str, Any], ...]
+    end_of_list: bool
+    last_load_ts: Optional[int]
+    last_modified_at: Optional[int]
+
+
+class SpeechSummary(NamedTuple):
+    """
+    The few attributes the speech listing shows
+    
+    A tuple per speech instead of the API's full dict keeps a large library
+    listing compact in memory.
+    """
+    speech_id: Optional[str]
+    title: Optional[str]
+    created_at: Optional[int]
+    duration: Optional[int]
+    
+    @classmethod
+    def from_dict(cls, speech: Dict[str, Any]) -> "SpeechSummary":
+        return cls(*(speech.get(field) for field in cls._fields))
 
 
 class OtterAuth:
     """Handles Otter.ai authentication and API calls"""
     
     def __init__(self):
-        self.otter: Optional[OtterAI] = None
+        self.otter: Optional["OtterAI"] = None
         self.authenticated: bool = False
+        # Fetches currently running, so concurrent identical calls can share one
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # bulk_export request parts that stay the same for the whole session
+        self.export_url: Optional[str] = None
+        self.export_params: Dict[str, Any] = {}
+        self.export_headers: Dict[str, str] = {}
+
+    def __enter__(self) -> "OtterAuth":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections"""
+        if self.otter is not None and hasattr(self.otter, '_session'):
+            self.otter._session.close()
+        self.authenticated = False
         
     def login(self, username: str, password: str) -> bool:
         """
@@ -38,28 +277,261 @@ class OtterAuth:
             True if authentication successful, False otherwise
             
         Raises:
-            Exception: For network or API errors
+            OtterAuthError: For network or API errors
         """
+        otterai = _load_otterai()
         try:
-            self.otter = OtterAI()
-            self.otter.login(username, password)
+            self.otter = otterai.OtterAI()
+            self._configure_session()
+            result = self.otter.login(username, password)
+            
+            # otterai reports a rejected login as a {'status': ...} dict rather than raising
+            if _response_status(result) != 200 or not self.otter._userid:
+                logger.debug("Login rejected (status %s)", _response_status(result))
+                self.authenticated = False
+                return False
+            
+            self._prepare_export()
             self.authenticated = True
+            self._save_session(username)
             return True
             
-        except OtterAIException as e:
+        except otterai.OtterAIException as e:
             # Handle specific Otter API errors
             if "unauthorized" in str(e).lower() or "invalid" in str(e).lower():
                 self.authenticated = False
                 return False
             else:
                 # Re-raise for other API errors
-                raise Exception(f"Otter.ai API error: {str(e)}")
+                raise OtterAuthError(f"Otter.ai API error: {e}") from e
                 
         except Exception as e:
             # Handle network or other errors
             logger.exception("Network or connection error during login")
-            raise Exception(f"Connection error: {str(e)}")
+            raise OtterAuthError(f"Connection error: {e}") from e
+    
+    def resume(self, username: str) -> bool:
+        """
+        Reuse the session saved by an earlier login, skipping the login round trips
+        
+        Args:
+            username: Otter.ai username/email the session must belong to
+            
+        Returns:
+            True if the saved cookies are still accepted, False if a full login is needed
+        """
+        saved = cache.load_session()
+        if not saved or saved.get('username') != username:
+            return False
+        
+        otterai = _load_otterai()
+        try:
+            self.otter = otterai.OtterAI()
+            self._configure_session()
+            for cookie in saved['cookies']:
+                self.otter._session.cookies.set(
+                    cookie['name'], cookie['value'], domain=cookie['domain'], path=cookie['path']
+                )
+            self.otter._userid = saved['userid']
+            self.otter._cookies = saved['otter_cookies']
+        except (KeyError, TypeError):
+            logger.debug("Saved session file is malformed", exc_info=True)
+            return self._abandon_resume(forget=True)
+        
+        try:
+            # Cheapest authenticated call, tells us whether the cookies are still good
+            probe = _retry(self.otter.get_user, "Checking saved session")
+        except Exception:
+            # A network failure says nothing about the cookies, so keep them for next time
+            logger.debug("Could not check saved session", exc_info=True)
+            return self._abandon_resume(forget=False)
+        
+        status = _response_status(probe)
+        if status in (401, 403):
+            logger.info("🔑 Saved session is no longer valid, logging in again")
+            return self._abandon_resume(forget=True)
+        if status != 200:
+            logger.info("🔑 Could not check saved session (status %s), logging in again", status)
+            return self._abandon_resume(forget=False)
+        
+        self._prepare_export()
+        self.authenticated = True
+        return True
+    
+    def _abandon_resume(self, forget: bool) -> bool:
+        """Drop the half-restored client; forget also deletes the saved session. Always returns False"""
+        if forget:
+            cache.clear_session()
+        self.close()
+        self.otter = None
+        return False
+    
+    def _save_session(self, username: str) -> None:
+        """Persist the login cookies so the next run can resume() instead of logging in"""
+        cache.store_session({
+            'username': username,
+            'userid': self.otter._userid,
+            'cookies': [
+                {'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path}
+                for c in self.otter._session.cookies
+            ],
+            'otter_cookies': self.otter._cookies,
+        })
+    
+    def _prepare_export(self) -> None:
+        """Build the bulk_export URL, query params and headers once per login"""
+        self.export_url = self.otter.API_BASE_URL + 'bulk_export'
+        self.export_params = {'userid': self.otter._userid, **EXPORT_OPTIONS}
+        self.export_headers = {
+            'x-csrftoken': self.otter._cookies['csrftoken'],
+            'referer': 'https://otter.ai/'
+        }
+    
+    def _configure_session(self) -> None:
+        """
+        Mount a larger keep-alive connection pool on the otterai session
+        
+        Every call (login, pagination, bulk_export) goes through this one
+        session, so pages 2..N reuse the TCP+TLS connection from page 1.
+        """
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        class ExportRetry(Retry):
+            """Retry that gives up at once for anything but POST, leaving those calls to _retry"""
+            
+            def increment(self, method=None, *args, **kwargs):
+                if method != 'POST':
+                    # Connect errors reach here whatever allowed_methods says
+                    return Retry.increment(self.new(total=0), method, *args, **kwargs)
+                return super().increment(method, *args, **kwargs)
+        
+        retries = ExportRetry(
+            total=ADAPTER_RETRIES,
+            read=0,
+            status_forcelist=RETRYABLE_STATUS_CODES,
+            allowed_methods=frozenset({'POST'}),
+            backoff_factor=ADAPTER_BACKOFF_FACTOR,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retries)
+        self.otter._session.mount('https://', adapter)
+    
+    def _singleflight(self, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Run fetch once for concurrent callers that share the same key
+        
+        A caller arriving while an identical fetch is already running waits for
+        that fetch and gets its result (or exception) instead of hitting the API
+        again. Sequential calls are unaffected.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._inflight[key] = Future()
+        
+        if not is_leader:
+            logger.debug("⏳ Joining in-flight fetch %s", key)
+            return future.result()
+        
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
     
+    def _fetch_page(
+        self,
+        folder: int,
+        source: str,
+        page_size: int,
+        last_load_ts: Optional[int] = None,
+        modified_after: Optional[int] = None,
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> SpeechPage:
+        """
+        Fetch a single page from the speeches endpoint
+        
+        Every call goes to the server: the first page changes whenever a new
+        recording lands, and the on-disk ETag cache already makes unchanged
+        pages cheap. When fields is given, only those speech attributes are requested
+        (the same projection the Otter web UI uses for its list view).
+        
+        Raises:
+            OtterAuthError: If the API responds with a non-200 status
+        """
+        params = {
+            'userid': self.otter._userid,
+            'folder': folder,
+            'page_size': page_size,
+            'source': source
+        }
+        if last_load_ts is not None:
+            params['last_load_ts'] = last_load_ts
+        if modified_after is not None:
+            params['modified_after'] = modified_after
+        if fields:
+            params['fields'] = ','.join(fields)
+        
+        # Revalidate against the copy from a previous run; a 304 skips the body
+        cached = cache.load_page(params)
+        headers = {'If-None-Match': cached['etag']} if cached else {}
+        
+        logger.debug("📡 API params: %s", params)
+        response = _retry(
+            lambda: self.otter._session.get(SPEECHES_URL, params=params, headers=headers),
+            "Fetching speeches"
+        )
+        
+        if response.status_code == 304 and cached:
+            logger.debug("📦 Page not modified, using cached copy")
+            data: SpeechesData = cached['body']
+        elif response.status_code != 200:
+            logger.error("❌ API error: %d - %s", response.status_code, response.text)
+            raise OtterAuthError(f"API error: {response.status_code}")
+        else:
+            data = _loads(response.content)
+            etag = response.headers.get('ETag')
+            if etag:
+                cache.store_page(params, etag, data)
+        
+        speeches = self._extract_speeches({'status': response.status_code, 'data': data})
+        return SpeechPage(
+            speeches=tuple(speeches),
+            end_of_list=data.get('end_of_list', True),
+            last_load_ts=data.get('last_load_ts'),
+            last_modified_at=data.get('last_modified_at')
+        )
+    
+    @staticmethod
+    def _extract_speeches(response: SpeechesResponse) -> List[Dict[str, Any]]:
+        """
+        Pull the speech list out of an otterai response
+        
+        The real API always answers with data['speeches'], so that is tried
+        first with plain lookups. Other shapes (data holding 'results', or the
+        list itself) go through the slower checks; anything else yields [].
+        """
+        try:
+            speeches = response['data']['speeches']
+            if type(speeches) is list:
+                return speeches
+        except (KeyError, TypeError):
+            pass
+        
+        data = response.get('data') if isinstance(response, dict) else None
+        if isinstance(data, dict):
+            data = data['speeches'] if 'speeches' in data else data.get('results')
+        return data if isinstance(data, list) else []
+    
+    @require_auth
     def get_speeches(self) -> List[Dict[str, Any]]:
         """
         Get list of user's speeches
@@ -68,186 +540,91 @@ class OtterAuth:
             List of speech dictionaries
             
         Raises:
-            Exception: If not authenticated or API error
+            NotAuthenticatedError: If login hasn't succeeded
+            OtterAuthError: On API error
         """
-        if not self.authenticated or not self.otter:
-            raise Exception("Not authenticated. Please login first.")
-            
         try:
             logger.info("🔍 Calling otter.get_speeches()...")
-            response = self.otter.get_speeches()
+            response = self._singleflight(
+                ('speeches',),
+                lambda: _retry(self.otter.get_speeches, "Fetching speeches")
+            )
             
-            logger.info(f"📡 Raw API response type: {type(response)}")
-            logger.info(f"📡 Raw API response: {json.dumps(response, indent=2, default=str) if response else 'None'}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📡 Raw API response: %s", _dumps(response) if TRACE else _shape(response))
             
-            # Handle case where API returns None or empty
-            if response is None:
-                logger.warning("⚠️ API returned None response")
-                return []
-                
-            # The otterai API returns {'status': status_code, 'data': actual_data}
-            if isinstance(response, dict) and 'data' in response:
-                data = response['data']
-                logger.info(f"📊 Response data type: {type(data)}")
-                logger.info(f"📊 Response data keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-                
-                # Handle different data structures
-                if isinstance(data, dict):
-                    # Check for common patterns
-                    if 'speeches' in data:
-                        speeches = data['speeches']
-                        logger.info(f"🎙️ Found 'speeches' key with {len(speeches) if isinstance(speeches, list) else 'non-list'} items")
-                    elif 'results' in data:
-                        speeches = data['results']
-                        logger.info(f"🎙️ Found 'results' key with {len(speeches) if isinstance(speeches, list) else 'non-list'} items")
-                    else:
-                        # The data might be the speeches directly
-                        speeches = data
-                        logger.info(f"🎙️ Using data directly as speeches (type: {type(speeches)})")
-                    
-                    if isinstance(speeches, list):
-                        logger.info(f"✅ Returning {len(speeches)} speeches")
-                        if speeches and len(speeches) > 0:
-                            logger.info(f"📝 First speech keys: {list(speeches[0].keys()) if isinstance(speeches[0], dict) else 'Not a dict'}")
-                        return speeches
-                    else:
-                        logger.warning(f"⚠️ Speeches is not a list: {type(speeches)}")
-                        return []
-                        
-                elif isinstance(data, list):
-                    logger.info(f"✅ Data is a list with {len(data)} items")
-                    return data
-                else:
-                    logger.warning(f"⚠️ Data is neither dict nor list: {type(data)}")
-                    return []
-            else:
-                # Fallback for unexpected response format
-                logger.warning(f"⚠️ Unexpected response format: {type(response)}")
-                logger.warning(f"⚠️ Response keys: {list(response.keys()) if isinstance(response, dict) else 'Not a dict'}")
-                return []
+            speeches = self._extract_speeches(response)
+            logger.info("✅ Returning %d speeches", len(speeches))
+            return speeches
                 
-        except OtterAIException as e:
-            logger.exception("Failed to fetch speeches - OtterAI API error")
-            raise Exception(f"Failed to fetch speeches: {str(e)}")
         except Exception as e:
-            logger.exception("Error fetching speeches - general error")
-            raise Exception(f"Error fetching speeches: {str(e)}")
+            logger.exception("Failed to fetch speeches")
+            raise OtterAuthError(f"Failed to fetch speeches: {e}") from e
     
+    @require_auth
     def get_speeches_with_size(self, page_size: int = 45, folder: int = 0, source: str = "owned") -> List[Dict[str, Any]]:
         """
         Get speeches with specific page size for testing pagination
         """
-        if not self.authenticated or not self.otter:
-            raise Exception("Not authenticated. Please login first.")
-            
         try:
-            response = self.otter.get_speeches(folder=folder, page_size=page_size, source=source)
+            response = self._singleflight(
+                ('speeches', folder, source, page_size),
+                lambda: _retry(
+                    lambda: self.otter.get_speeches(folder=folder, page_size=page_size, source=source),
+                    "Fetching speeches"
+                )
+            )
             
-            # Same parsing logic but without debug prints
-            if response is None:
-                return []
-                
-            if isinstance(response, dict) and 'data' in response:
-                data = response['data']
-                
-                if isinstance(data, dict):
-                    if 'speeches' in data:
-                        speeches = data['speeches']
-                    elif 'results' in data:
-                        speeches = data['results']  
-                    else:
-                        speeches = data
-                        
-                    if isinstance(speeches, list):
-                        return speeches
-                    else:
-                        return []
-                        
-                elif isinstance(data, list):
-                    return data
-                else:
-                    return []
-            else:
-                    return []
+            return self._extract_speeches(response)
                 
-        except OtterAIException as e:
-            logger.exception("Failed to fetch speeches with specific size - OtterAI API error")
-            raise Exception(f"Failed to fetch speeches: {str(e)}")
         except Exception as e:
-            logger.exception("Error fetching speeches with specific size - general error")
-            raise Exception(f"Error fetching speeches: {str(e)}")
+            logger.exception("Failed to fetch speeches with specific size")
+            raise OtterAuthError(f"Failed to fetch speeches: {e}") from e
     
-    def get_all_speeches(self, folder: int = 0, source: str = "owned") -> List[Dict[str, Any]]:
+    @require_auth
+    def get_all_speeches(
+        self, folder: int = 0, source: str = "owned", fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get ALL speeches using pagination, following end_of_list indicator
         
+        Args:
+            folder: Folder ID to search in
+            source: Source type ("owned", "shared", etc.)
+            fields: Speech attributes to request; None fetches full records
+            
         Returns:
             Complete list of all speech dictionaries
         """
-        if not self.authenticated or not self.otter:
-            raise Exception("Not authenticated. Please login first.")
-            
-        all_speeches = []
-        last_load_ts = None
-        page_count = 0
+        fields = tuple(fields) if fields else None
+        return self._singleflight(
+            ('all_speeches', folder, source, fields),
+            lambda: list(self.iter_all_speeches(folder=folder, source=source, fields=fields))
+        )
+    
+    @require_auth
+    def iter_all_speeches(
+        self, folder: int = 0, source: str = "owned", fields: Optional[Sequence[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream ALL speeches one at a time, fetching pages as they are consumed
         
-        logger.info(f"🔄 Starting paginated fetch with folder={folder}, source={source}")
+        Pages are fetched one after another on purpose: the speeches endpoint
+        has no offset/page-number parameter, and the next page's last_load_ts
+        cursor is only known once the previous page has come back.
         
-        try:
-            while True:
-                page_count += 1
-                logger.info(f"📄 Fetching page {page_count}...")
-                
-                # Get a batch of speeches with large page size
-                response = self.otter.get_speeches(folder=folder, page_size=500, source=source)
-                
-                logger.info(f"📡 Page {page_count} response type: {type(response)}")
-                if response:
-                    logger.info(f"📡 Page {page_count} response keys: {list(response.keys()) if isinstance(response, dict) else 'Not a dict'}")
-                
-                if response is None or not isinstance(response, dict) or 'data' not in response:
-                    logger.warning(f"⚠️ Page {page_count} has invalid response structure, stopping")
-                    break
-                    
-                data = response['data']
-                logger.info(f"📊 Page {page_count} data type: {type(data)}")
-                logger.info(f"📊 Page {page_count} data keys: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-                
-                # Extract speeches from this batch
-                if isinstance(data, dict):
-                    batch_speeches = data.get('speeches', [])
-                    end_of_list = data.get('end_of_list', True)
-                    last_load_ts = data.get('last_load_ts')
-                    
-                    logger.info(f"🎙️ Page {page_count}: {len(batch_speeches) if isinstance(batch_speeches, list) else 'non-list'} speeches, end_of_list={end_of_list}")
-                    
-                    if isinstance(batch_speeches, list):
-                        all_speeches.extend(batch_speeches)
-                        logger.info(f"📈 Total speeches so far: {len(all_speeches)}")
-                    
-                    # Check if we've reached the end
-                    if end_of_list:
-                        logger.info(f"🏁 Reached end of list on page {page_count}")
-                        break
-                        
-                    # Safety check to prevent infinite loops
-                    if page_count > 100:  # Max 50,000 speeches
-                        logger.warning(f"⚠️  Safety limit reached: {page_count} pages, {len(all_speeches)} speeches")
-                        break
-                else:
-                    logger.warning(f"⚠️ Page {page_count} data is not a dict: {type(data)}")
-                    break
-            
-            logger.info(f"✅ Completed pagination: {len(all_speeches)} total speeches across {page_count} pages")
-            return all_speeches
+        Args:
+            folder: Folder ID to search in
+            source: Source type ("owned", "shared", etc.)
+            fields: Speech attributes to request; None fetches full records
             
-        except OtterAIException as e:
-            logger.exception("Failed to fetch all speeches - OtterAI API error")
-            raise Exception(f"Failed to fetch all speeches: {str(e)}")
-        except Exception as e:
-            logger.exception("Error fetching all speeches - general error")
-            raise Exception(f"Error fetching all speeches: {str(e)}")
+        Yields:
+            Speech dictionaries, in API order
+        """
+        for batch in self.get_speeches_batch(batch_size=LIST_PAGE_SIZE, folder=folder, source=source, fields=fields):
+            yield from batch
     
+    @require_auth
     def get_speeches_direct(self, page_size: int = 50, folder: int = 0, source: str = "owned"):
         """
         Get speeches using direct API calls, bypassing the broken otterai library
@@ -260,9 +637,6 @@ class OtterAuth:
         Returns:
             List[Dict]: List of speech dictionaries
         """
-        if not self.authenticated or not self.otter:
-            raise Exception("Not authenticated. Please login first.")
-            
         try:
             params = {
                 'userid': self.otter._userid,
@@ -271,28 +645,31 @@ class OtterAuth:
                 'source': source
             }
             
-            logger.info(f"📡 Direct API call: page_size={page_size}, folder={folder}, source={source}")
+            logger.info("📡 Direct API call: page_size=%d, folder=%s, source=%s", page_size, folder, source)
             
-            response = self.otter._session.get(
-                'https://otter.ai/forward/api/v1/speeches', 
-                params=params
+            response = _retry(
+                lambda: self.otter._session.get('https://otter.ai/forward/api/v1/speeches', params=params),
+                "Fetching speeches"
             )
             
             if response.status_code != 200:
-                logger.error(f"❌ API error: {response.status_code} - {response.text}")
-                raise Exception(f"API error: {response.status_code}")
+                logger.error("❌ API error: %d - %s", response.status_code, response.text)
+                raise OtterAuthError(f"API error: {response.status_code}")
             
-            data = response.json()
+            data = _loads(response.content)
             speeches = data.get('speeches', [])
             
-            logger.info(f"✅ Retrieved {len(speeches)} speeches via direct API")
+            logger.info("✅ Retrieved %d speeches via direct API", len(speeches))
             return speeches
             
         except Exception as e:
             logger.exception("Error in direct API call")
-            raise Exception(f"Direct API call failed: {str(e)}")
+            raise OtterAuthError(f"Direct API call failed: {e}") from e
 
-    def get_speeches_batch(self, batch_size: int = 50, folder: int = 0, source: str = "owned"):
+    @require_auth
+    def get_speeches_batch(
+        self, batch_size: int = 50, folder: int = 0, source: str = "owned", fields: Optional[Sequence[str]] = None
+    ):
         """
         Generator that yields batches of speeches using proper pagination
         
@@ -304,95 +681,84 @@ class OtterAuth:
             batch_size: Number of speeches per batch (default: 50)
             folder: Folder ID to search in
             source: Source type ("owned", "shared", etc.)
+            fields: Speech attributes to request; None fetches full records
             
         Yields:
             List[Dict]: Batch of speech dictionaries
         """
-        if not self.authenticated or not self.otter:
-            raise Exception("Not authenticated. Please login first.")
-            
-        logger.info(f"🔄 Starting proper pagination with batch_size={batch_size}")
+        logger.info("🔄 Starting proper pagination with batch_size=%d", batch_size)
         
         try:
             batch_count = 0
             total_yielded = 0
             last_load_ts = None
             modified_after = None
+            seen_ids: Set[str] = set()
+            fields = tuple(fields) if fields else None
             
-            while True:
-                batch_count += 1
-                logger.info(f"📄 Fetching batch {batch_count} via paginated API...")
-                
-                # Build parameters for proper pagination
-                params = {
-                    'userid': self.otter._userid,
-                    'folder': folder,
-                    'page_size': batch_size,
-                    'source': source
-                }
-                
-                # Add pagination cursors if we have them
-                if last_load_ts is not None:
-                    params['last_load_ts'] = last_load_ts
-                if modified_after is not None:
-                    params['modified_after'] = modified_after
-                
-                logger.info(f"📡 API params: {params}")
+            # One background worker keeps the next page in flight while the
+            # caller is busy with the current batch
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                next_page = executor.submit(self._fetch_page, folder, source, batch_size, None, None, fields)
                 
-                # Make API call
-                response = self.otter._session.get(
-                    'https://otter.ai/forward/api/v1/speeches', 
-                    params=params
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"❌ API error: {response.status_code} - {response.text}")
-                    break
-                
-                data = response.json()
-                batch_speeches = data.get('speeches', [])
-                end_of_list = data.get('end_of_list', True)
-                new_last_load_ts = data.get('last_load_ts')
-                new_modified_after = data.get('last_modified_at')
-                
-                logger.info(f"🎙️ Batch {batch_count}: {len(batch_speeches)} speeches, end_of_list={end_of_list}")
-                logger.info(f"📊 Pagination cursors: last_load_ts={new_last_load_ts}, modified_after={new_modified_after}")
-                
-                if not batch_speeches or len(batch_speeches) == 0:
-                    logger.info(f"🏁 No more speeches in batch {batch_count}, stopping")
-                    break
-                
-                total_yielded += len(batch_speeches)
-                logger.info(f"📦 Yielding batch {batch_count}: {len(batch_speeches)} speeches (total so far: {total_yielded})")
-                yield batch_speeches
-                
-                # Update pagination cursors for next batch
-                if new_last_load_ts:
-                    last_load_ts = new_last_load_ts
-                if new_modified_after:
-                    modified_after = new_modified_after
-                
-                # Check if we've reached the end
-                if end_of_list:
-                    logger.info(f"🏁 Reached end_of_list on batch {batch_count}")
-                    break
-                
-                # If we got fewer speeches than requested, we've reached the end
-                if len(batch_speeches) < batch_size:
-                    logger.info(f"🏁 Reached end - got {len(batch_speeches)} < {batch_size} requested")
-                    break
-                
-                # Safety check to prevent infinite loops
-                if batch_count > 100:  # Max 5,000 speeches with batch_size=50
-                    logger.warning(f"⚠️  Safety limit reached: {batch_count} batches, {total_yielded} speeches")
-                    break
+                while True:
+                    batch_count += 1
+                    logger.info("📄 Fetching batch %d via paginated API...", batch_count)
+                    
+                    page = next_page.result()
+                    fetched = len(page.speeches)
+                    end_of_list = page.end_of_list
+                    new_last_load_ts = page.last_load_ts
+                    new_modified_after = page.last_modified_at
+                    
+                    logger.info("🎙️ Batch %d: %d speeches, end_of_list=%s", batch_count, fetched, end_of_list)
+                    logger.debug("📊 Pagination cursors: last_load_ts=%s, modified_after=%s", new_last_load_ts, new_modified_after)
+                    
+                    if fetched == 0:
+                        logger.info("🏁 No more speeches in batch %d, stopping", batch_count)
+                        break
+                    
+                    # Update pagination cursors for next batch
+                    if new_last_load_ts:
+                        last_load_ts = new_last_load_ts
+                    if new_modified_after:
+                        modified_after = new_modified_after
+                    
+                    # Check if we've reached the end before prefetching
+                    if end_of_list:
+                        logger.info("🏁 Reached end_of_list on batch %d", batch_count)
+                        has_more = False
+                    elif fetched < batch_size:
+                        # If we got fewer speeches than requested, we've reached the end
+                        logger.info("🏁 Reached end - got %d < %d requested", fetched, batch_size)
+                        has_more = False
+                    elif batch_count > 100:  # Max 5,000 speeches with batch_size=50
+                        # Safety check to prevent infinite loops
+                        logger.warning("⚠️  Safety limit reached: %d batches, %d speeches", batch_count, total_yielded)
+                        has_more = False
+                    else:
+                        has_more = True
+                        next_page = executor.submit(
+                            self._fetch_page, folder, source, batch_size, last_load_ts, modified_after, fields
+                        )
+                    
+                    # Skip speeches the server already returned on an earlier page
+                    batch_speeches = _unseen(page.speeches, seen_ids)
+                    if batch_speeches:
+                        total_yielded += len(batch_speeches)
+                        logger.info("📦 Yielding batch %d: %d speeches (total so far: %d)", batch_count, len(batch_speeches), total_yielded)
+                        yield batch_speeches
+                    
+                    if not has_more:
+                        break
             
-            logger.info(f"✅ Completed pagination: {total_yielded} total speeches across {batch_count} batches")
+            logger.info("✅ Completed pagination: %d total speeches across %d batches", total_yielded, batch_count)
                 
         except Exception as e:
             logger.exception("Error in paginated batch processing")
-            raise Exception(f"Paginated batch processing failed: {str(e)}")
+            raise OtterAuthError(f"Paginated batch processing failed: {e}") from e
 
+    @require_auth
     def get_user_info(self) -> Dict[str, Any]:
         """
         Get user information
@@ -400,10 +766,7 @@ class OtterAuth:
         Returns:
             User info dictionary
         """
-        if not self.authenticated or not self.otter:
-            raise Exception("Not authenticated. Please login first.")
-            
         try:
             return self.otter.get_user()
         except Exception as e:
-            raise Exception(f"Failed to get user info: {str(e)}")
+            raise OtterAuthError(f"Failed to get user info: {e}") from e
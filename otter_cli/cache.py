@@ -0,0 +1,120 @@
+"""
+On-disk cache for Otter.ai API responses and login sessions
+Stores speech-list pages with their ETag so repeat runs can revalidate instead of re-downloading,
+and the last login's cookies so repeat runs can skip logging in
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path.home() / '.cache' / 'otter-cli'
+PAGES_DIR = CACHE_DIR / 'pages'
+SESSION_FILE = CACHE_DIR / 'session.json'
+
+# Page keys include the paging cursor, so each new recording orphans the old set;
+# pages untouched this long are dropped, and the oldest beyond the cap go first
+PAGE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+MAX_PAGES = 1000
+
+# Pruning scans the whole directory, so it runs once per process
+_pages_pruned = False
+
+
+def _page_path(params: Dict[str, Any]) -> Path:
+    """Cache file for a speeches request, keyed by its full query parameters"""
+    key = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    return PAGES_DIR / f"{key}.json"
+
+
+def load_page(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached speeches page
+
+    Returns:
+        {'etag': ..., 'body': ...} or None if nothing usable is cached
+    """
+    try:
+        with open(_page_path(params), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_private(path: Path, data: Any) -> None:
+    """Atomically write JSON to an owner-only file; failures are logged and swallowed"""
+    tmp = path.with_suffix('.tmp')
+    try:
+        # mkdir's mode only applies to the last directory, so create the cache root explicitly
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path.parent.mkdir(mode=0o700, exist_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        logger.debug("Could not write cache file %s", path, exc_info=True)
+
+
+def _prune_pages() -> None:
+    """Delete cached pages older than PAGE_MAX_AGE_SECONDS, then the oldest beyond MAX_PAGES"""
+    try:
+        with os.scandir(PAGES_DIR) as entries:
+            pages = sorted(
+                ((entry.stat().st_mtime, entry.path) for entry in entries if entry.name.endswith('.json')),
+                reverse=True
+            )
+    except OSError:
+        return
+    
+    cutoff = time.time() - PAGE_MAX_AGE_SECONDS
+    for index, (mtime, path) in enumerate(pages):
+        if index >= MAX_PAGES or mtime < cutoff:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def store_page(params: Dict[str, Any], etag: str, body: Any) -> None:
+    """Save a speeches page and its ETag; failures only cost a future cache miss"""
+    global _pages_pruned
+    if not _pages_pruned:
+        _pages_pruned = True
+        _prune_pages()
+    
+    # Speech titles and summaries are private, keep the file owner-only
+    _write_private(_page_path(params), {'etag': etag, 'body': body})
+
+
+def load_session() -> Optional[Dict[str, Any]]:
+    """
+    Load the session saved by the last successful login
+    
+    Returns:
+        {'username': ..., 'userid': ..., 'cookies': [...], 'otter_cookies': {...}} or None
+    """
+    try:
+        with open(SESSION_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def store_session(session: Dict[str, Any]) -> None:
+    """Save login cookies; they grant account access, so the file is owner-only"""
+    _write_private(SESSION_FILE, session)
+
+
+def clear_session() -> None:
+    """Forget the saved session, e.g. once the server has rejected it"""
+    try:
+        SESSION_FILE.unlink()
+    except OSError:
+        pass
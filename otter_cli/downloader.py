@@ -2,32 +2,105 @@
 Clean, simple downloader - no defensive programming bullshit
 """
 
+import io
 import os
 import time
+import zipfile
 import logging
 import json
-import yaml
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, Callable, List, Dict, Any, Iterable, Iterator, Optional, Set
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn
 from rich.panel import Panel
 
 from .auth import OtterAuth
-from .utils import slugify
+from .utils import RateLimiter, slugify
+
+# PyYAML and rich.progress are imported where they're used so `--help` and `login` don't load them
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Strings YAML reads back as the same string without quotes; anything else gets double-quoted
+_PLAIN_YAML = re.compile(r"[^\W\d][\w .,/()'&+-]*(?<! )")
+_YAML_RESERVED = frozenset({'y', 'n', 'yes', 'no', 'true', 'false', 'on', 'off', 'null'})
+_YAML_ESCAPE = re.compile('[\x7f-\x9f\u2028\u2029\ufffe\uffff]')
+
+# Downloads are pure network waits, so a few run side by side
+DOWNLOAD_WORKERS = 4
+
+# Speeches per bulk_export request; 1 keeps the proven one-file-per-request path
+EXPORT_BATCH_SIZE = 1
+
+# Speeches per listing page when walking the whole library
+LISTING_BATCH_SIZE = 50
+
+# Read size when streaming an export to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Per-folder record of each saved transcript's transcript_updated_at
+SIDECAR_NAME = '.otter-cache.json'
+
+# Suffix for transcripts still being written
+PARTIAL_SUFFIX = '.part'
+
+# Minimum seconds between progress bar description changes and result-line flushes
+PROGRESS_REFRESH_INTERVAL = 0.1
+
+
+def _yaml_scalar(value: Any) -> str:
+    """A single YAML scalar: plain when it reads back unchanged, double-quoted otherwise"""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return repr(value)
+    # Floats are left to PyYAML: YAML 1.1 reads repr() forms like 1e+16 back as strings
+    if not isinstance(value, str):
+        raise TypeError(f"Unsupported frontmatter value: {value!r}")
+    if _PLAIN_YAML.fullmatch(value) and value.lower() not in _YAML_RESERVED:
+        return value
+    # A JSON string is a valid YAML double-quoted scalar once YAML's extra non-printables are escaped
+    return _YAML_ESCAPE.sub(lambda m: f"\\u{ord(m.group()):04x}", json.dumps(value, ensure_ascii=False))
+
+
+def _yaml_lines(data: Dict[str, Any], indent: str = '') -> Iterator[str]:
+    """
+    Block-style YAML for the frontmatter's fixed shape
+    
+    Handles scalars, lists of scalars and nested dicts, laid out the way
+    yaml.dump(default_flow_style=False) would, without its representer machinery.
+    """
+    for key, value in data.items():
+        key = _yaml_scalar(key)
+        if isinstance(value, dict):
+            if value:
+                yield f"{indent}{key}:"
+                yield from _yaml_lines(value, indent + '  ')
+            else:
+                yield f"{indent}{key}: {{}}"
+        elif isinstance(value, list):
+            if value:
+                yield f"{indent}{key}:"
+                for item in value:
+                    yield f"{indent}- {_yaml_scalar(item)}"
+            else:
+                yield f"{indent}{key}: []"
+        else:
+            yield f"{indent}{key}: {_yaml_scalar(value)}"
+
 
 def generate_frontmatter(speech: Dict[str, Any]) -> str:
     """Generate YAML frontmatter from speech metadata"""
-    # Convert timestamps to ISO format
+    # Convert timestamps to ISO format (UTC, matching the Z suffix)
     def timestamp_to_iso(timestamp):
         if timestamp:
-            return datetime.fromtimestamp(timestamp).isoformat() + 'Z'
+            return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp))
         return None
     
     # Extract speaker information
@@ -68,7 +141,19 @@ def generate_frontmatter(speech: Dict[str, Any]) -> str:
     }
     
     # Convert to YAML and wrap in frontmatter markers
-    yaml_content = yaml.dump(frontmatter_data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    try:
+        yaml_content = ''.join(f"{line}\n" for line in _yaml_lines(frontmatter_data))
+    except TypeError:
+        # Something outside the usual schema (e.g. a non-string title); let PyYAML handle it
+        import yaml
+        try:
+            # libyaml's C emitter when PyYAML was built with it, the pure-Python one otherwise
+            from yaml import CSafeDumper as _YamlDumper
+        except ImportError:
+            from yaml import SafeDumper as _YamlDumper
+        yaml_content = yaml.dump(
+            frontmatter_data, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, allow_unicode=True
+        )
     return f"---\n{yaml_content}---\n\n"
 
 
@@ -113,71 +198,331 @@ def get_clean_filename(speech: Dict[str, Any], format: str = "txt") -> str:
     return f"{title_slug}.{speakers_part}.{speech_id}.{format}"
 
 
-def speech_already_downloaded(speech_id: str, download_folder: Path, format: str = "txt") -> bool:
-    """Check if speech already downloaded by looking for speech_id in filename"""
-    pattern = f"*.{speech_id}.{format}"
-    matches = list(download_folder.glob(pattern))
-    return len(matches) > 0
+def existing_speech_ids(download_folder: Path, format: str = "txt") -> Set[str]:
+    """Speech IDs already downloaded, read from $title.speakers.$id.$format filenames in one folder scan"""
+    suffix = f".{format}"
+    ids = set()
+    # Plain names from scandir, no Path object or fnmatch per entry
+    with os.scandir(download_folder) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(suffix):
+                ids.add(name[:-len(suffix)].rsplit('.', 1)[-1])
+    return ids
 
 
-def set_file_timestamp(filepath: Path, speech: Dict[str, Any]):
-    """Set file modification time to speech creation time"""
+def load_sidecar(download_folder: Path) -> Dict[str, Any]:
+    """Load {speech_id: transcript_updated_at} for transcripts saved in this folder"""
+    try:
+        with open(download_folder / SIDECAR_NAME, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sidecar(download_folder: Path, updated_at: Dict[str, Any]):
+    """Atomically save the {speech_id: transcript_updated_at} record; failures are logged and swallowed"""
+    path = download_folder / SIDECAR_NAME
+    tmp = path.with_name(path.name + PARTIAL_SUFFIX)
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(updated_at, f)
+        os.replace(tmp, path)
+    except OSError:
+        # Only costs re-downloads on the next --overwrite run
+        logger.warning("⚠️ Could not save %s", path, exc_info=True)
+
+
+def speech_timestamp(speech: Dict[str, Any]) -> Optional[float]:
+    """Speech creation time as a POSIX timestamp, if the API gave one"""
     created_at = speech.get('created_at') or speech.get('start_time') or speech.get('displayed_start_time')
     if created_at and isinstance(created_at, (int, float)):
-        timestamp = float(created_at)
-        os.utime(filepath, (timestamp, timestamp))
+        return float(created_at)
+    return None
+
+
+def set_file_timestamp(filepath: Path, speech: Dict[str, Any]):
+    """Set file modification time to speech creation time"""
+    timestamp = speech_timestamp(speech)
+    if timestamp is None:
+        return
+    
+    # Leave files that already carry the right time untouched
+    try:
+        if abs(os.stat(filepath).st_mtime - timestamp) < 1.0:
+            return
+    except OSError:
+        pass
+    os.utime(filepath, (timestamp, timestamp))
+
+
+def _same_contents(path: Path, other: Path) -> bool:
+    """Byte-for-byte comparison; filecmp caches by (size, mtime), which our timestamps make identical"""
+    try:
+        if os.path.getsize(path) != os.path.getsize(other):
+            return False
+        with open(path, 'rb') as a, open(other, 'rb') as b:
+            while True:
+                chunk = a.read(DOWNLOAD_CHUNK_SIZE)
+                if chunk != b.read(DOWNLOAD_CHUNK_SIZE):
+                    return False
+                if not chunk:
+                    return True
+    except FileNotFoundError:
+        return False
+
+
+def _post_export(auth: OtterAuth, otids: List[str], format: str, stream: bool = False):
+    """POST a bulk_export request for the given otids"""
+    data = {
+        'formats': format,
+        'speech_otid_list': otids
+    }
+    
+    return auth.otter._session.post(
+        auth.export_url, params=auth.export_params, headers=auth.export_headers, data=data, stream=stream
+    )
+
+
+def _write_transcript(filepath: Path, speech: Dict[str, Any], chunks: Iterable[bytes]):
+    """Write an exported transcript with its frontmatter and set its timestamp"""
+    # Generate frontmatter
+    frontmatter = generate_frontmatter(speech)
+    
+    # Write to a .part file first, so an interrupted download never looks finished
+    partial = filepath.with_name(filepath.name + PARTIAL_SUFFIX)
+    try:
+        # Write content with frontmatter, chunk by chunk as it arrives
+        with open(partial, 'wb') as f:
+            f.write(frontmatter.encode('utf-8'))
+            for chunk in chunks:
+                f.write(chunk)
+            
+            # Set timestamp on the open file, saving a second path lookup
+            if os.utime in os.supports_fd:
+                f.flush()
+                timestamp = speech_timestamp(speech)
+                if timestamp is not None:
+                    os.utime(f.fileno(), (timestamp, timestamp))
+        
+        if os.utime not in os.supports_fd:
+            set_file_timestamp(partial, speech)
+        
+        # A re-download that came back identical leaves the existing file alone,
+        # so sync clients like Dropbox don't see a change and re-upload it
+        if _same_contents(partial, filepath):
+            partial.unlink()
+            set_file_timestamp(filepath, speech)
+            return
+        
+        os.replace(partial, filepath)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
 
 
 def download_speech(auth: OtterAuth, speech: Dict[str, Any], download_folder: Path, format: str = "txt") -> bool:
     """Download a single speech with optimal LLM-friendly formatting"""
     otid = speech['otid']  # API needs otid for download
-    speech_id = speech['speech_id']  # We use speech_id for filename
     filename = get_clean_filename(speech, format)
     filepath = download_folder / filename
     
-    # Make direct API call with optimal parameters for LLM processing
-    download_url = auth.otter.API_BASE_URL + 'bulk_export'
-    payload = {
-        'userid': auth.otter._userid,
-        'speaker_names': 1,  # Include speaker names
-        'speaker_timestamps': 0,  # NO timestamps (better for LLM)
-        'merge_same_speaker_segments': 1,  # Combine same speaker paragraphs
-        'show_highlights': 0,  # No highlights
-        'inline_pictures': 0,
-        'monologue': 0,
-        'highlight_only': 0,
-        'branding': 'false',
-        'annotations': 0
-    }
+    with _post_export(auth, [otid], format, stream=True) as response:
+        if response.status_code == 200:
+            _write_transcript(filepath, speech, response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE))
+            return True
+        else:
+            console.print(f"❌ Download failed: {speech['title']} (server error {response.status_code})")
+            return False
+
+
+def download_speech_batch(
+    auth: OtterAuth,
+    speeches: List[Dict[str, Any]],
+    download_folder: Path,
+    format: str = "txt",
+    limiter: Optional[RateLimiter] = None,
+    on_written: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> List[bool]:
+    """
+    Download several speeches with one bulk_export request
     
-    data = {
-        'formats': format,
-        'speech_otid_list': [otid]
-    }
+    Otter answers a multi-otid export with a zip archive; members are matched
+    back to speeches by otid. Any speech that can't be matched (or a 200
+    response that isn't an archive) falls back to a single download, each one
+    waiting on the limiter like any other request. Any other status sends no
+    fallback requests; the whole batch counts as errors instead.
     
-    headers = {
-        'x-csrftoken': auth.otter._cookies['csrftoken'], 
-        'referer': 'https://otter.ai/'
-    }
+    on_written is called with each speech as soon as its file is in place.
+    """
+    def download_one(speech: Dict[str, Any]) -> bool:
+        success = download_speech(auth, speech, download_folder, format)
+        if success and on_written is not None:
+            on_written(speech)
+        return success
+    
+    if len(speeches) == 1:
+        return [download_one(speeches[0])]
+    
+    response = _post_export(auth, [speech['otid'] for speech in speeches], format)
+    
+    # Per-speech requests would fail the same way (expired session, rate limit, bad
+    # request) and 429/5xx were already retried by the adapter, so only a 200 falls back
+    if response.status_code != 200:
+        console.print(f"❌ Batch download failed: {len(speeches)} speeches (server error {response.status_code})")
+        return [False] * len(speeches)
     
-    response = auth.otter._session.post(download_url, params=payload, headers=headers, data=data)
+    def download_fallback(speech: Dict[str, Any]) -> bool:
+        if limiter is not None:
+            limiter.acquire()
+        return download_one(speech)
     
-    if response.status_code == 200:
-        # Generate frontmatter
-        frontmatter = generate_frontmatter(speech)
+    written = set()
+    archive_bytes = io.BytesIO(response.content)
+    if zipfile.is_zipfile(archive_bytes):
+        with zipfile.ZipFile(archive_bytes) as archive:
+            names = archive.namelist()
+            for speech in speeches:
+                member = next((name for name in names if speech['otid'] in name), None)
+                if member is not None:
+                    filepath = download_folder / get_clean_filename(speech, format)
+                    _write_transcript(filepath, speech, [archive.read(member)])
+                    written.add(speech['otid'])
+                    if on_written is not None:
+                        on_written(speech)
+    else:
+        logger.info("📦 bulk_export returned no archive, downloading one by one")
+    
+    return [speech['otid'] in written or download_fallback(speech) for speech in speeches]
+
+
+def _progress() -> "Progress":
+    """Progress bar for a download run; rendering is skipped when output isn't a terminal"""
+    from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeRemainingColumn
+    
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeRemainingColumn(),
+        console=console,
+        disable=not console.is_terminal
+    )
+
+
+def _download_speeches(
+    auth: OtterAuth,
+    speeches: List[Dict[str, Any]],
+    *,
+    download_folder: Path,
+    format: str,
+    overwrite: bool,
+    force: bool,
+    min_transcript_length: int,
+    limiter: Optional[RateLimiter],
+    max_downloads: Optional[int],
+    workers: int,
+    export_batch_size: int,
+    existing_ids: Set[str],
+    updated_at: Dict[str, Any],
+    stats: Dict[str, Any],
+    progress: "Progress",
+    task
+) -> bool:
+    """
+    Skip what we already have, then download the rest in parallel
+    
+    Returns:
+        True once max_downloads has been reached
+    """
+    todo = []
+    skipped_lines = []
+    budget = max_downloads - stats['downloaded'] if max_downloads else None
+    for speech in speeches:
+        if budget is not None and len(todo) >= budget:
+            break
         
-        # Write content with frontmatter
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(frontmatter)
-            f.write(response.content.decode('utf-8'))
+        # Already downloaded? Checked first, it's what most speeches are on a re-run
+        speech_id = speech['speech_id']
+        if speech_id in existing_ids and not force:
+            # --overwrite only refetches transcripts Otter changed since we saved them
+            stamp = speech.get('transcript_updated_at')
+            if not overwrite or (stamp is not None and updated_at.get(speech_id) == stamp):
+                stats['skipped'] += 1
+                continue
         
-        # Set timestamp
-        set_file_timestamp(filepath, speech)
+        # Too short?
+        transcript = speech.get('transcript') or speech.get('summary') or ''
+        if transcript and len(transcript) < min_transcript_length:
+            stats['filtered'] += 1
+            skipped_lines.append(f"⏭️ Skipped: {speech['title'] or 'Untitled'} (too short - {len(transcript)} chars)")
+            continue
         
+        todo.append(speech)
+    
+    # One print for everything we didn't need to download
+    if skipped_lines:
+        console.print("\n".join(skipped_lines))
+    
+    # The bar only counts real downloads, so skipped speeches can't skew the ETA
+    if todo:
+        total = next(t.total for t in progress.tasks if t.id == task)
+        progress.update(task, total=total + len(todo))
+    
+    def record(speech: Dict[str, Any]):
+        # Runs on the worker as soon as the file lands, so the sidecar covers
+        # transcripts that finish after another chunk has failed
+        existing_ids.add(speech['speech_id'])
+        updated_at[speech['speech_id']] = speech.get('transcript_updated_at')
+    
+    def fetch(chunk: List[Dict[str, Any]]) -> List[bool]:
+        # One shared budget, so adding workers doesn't raise the request rate
+        if limiter is not None:
+            limiter.acquire()
+        return download_speech_batch(auth, chunk, download_folder, format, limiter, record)
+    
+    chunk_size = max(1, export_batch_size)
+    chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+    
+    last_refresh = 0.0
+    done_lines = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(fetch, chunk): chunk for chunk in chunks}
+        try:
+            for future in as_completed(futures):
+                chunk = futures[future]
+                for speech, success in zip(chunk, future.result()):
+                    title = speech['title'] or 'Untitled'
+                    if success:
+                        stats['downloaded'] += 1
+                        done_lines.append(f"✅ {title}")
+                    else:
+                        stats['errors'] += 1
+                
+                # Results arrive faster than anyone can read them; refresh the screen a few times a second
+                now = time.monotonic()
+                if now - last_refresh >= PROGRESS_REFRESH_INTERVAL:
+                    last_refresh = now
+                    progress.update(task, advance=len(chunk), description=f"Processing: {title[:40]}...")
+                    if done_lines:
+                        console.print("\n".join(done_lines))
+                        done_lines.clear()
+                else:
+                    progress.advance(task, len(chunk))
+        except BaseException:
+            # Fail fast: don't let queued chunks keep downloading behind an error or Ctrl-C
+            for future in futures:
+                future.cancel()
+            raise
+    
+    if done_lines:
+        console.print("\n".join(done_lines))
+    
+    if max_downloads and stats['downloaded'] >= max_downloads:
+        console.print(f"🛑 Downloaded maximum limit ({max_downloads} files)")
         return True
-    else:
-        console.print(f"❌ Download failed: {speech['title']} (server error {response.status_code})")
-        return False
+    return False
 
 
 def clean_download_all(
@@ -185,165 +530,91 @@ def clean_download_all(
     folder: str = "~/Dropbox/Otter-Export", 
     format: str = "txt",
     overwrite: bool = False,
+    force: bool = False,
     sleep_seconds: float = 0.5,
     min_transcript_length: int = 200,
-    max_downloads: Optional[int] = None
+    max_downloads: Optional[int] = None,
+    workers: int = DOWNLOAD_WORKERS,
+    export_batch_size: int = EXPORT_BATCH_SIZE
 ) -> Dict[str, Any]:
     """
     Simple download: Get speeches, download missing ones
+    
+    With overwrite, already-downloaded speeches are fetched again only when
+    their transcript_updated_at changed; force re-downloads everything.
     """
     # Setup
     download_folder = Path(folder).expanduser()
     download_folder.mkdir(parents=True, exist_ok=True)
     
+    # Leftovers from an interrupted run; those speeches get downloaded again below
+    for partial in download_folder.glob(f"*.{format}{PARTIAL_SUFFIX}"):
+        partial.unlink(missing_ok=True)
+    
+    existing_ids = existing_speech_ids(download_folder, format)
+    updated_at = load_sidecar(download_folder)
+    saved_updated_at = dict(updated_at)
+    limiter = RateLimiter(1 / sleep_seconds) if sleep_seconds > 0 else None
+    
     # Get speeches - use efficient method based on max_downloads
     console.print("📜 Loading your transcript library...")
     
     if max_downloads and max_downloads <= 100:
-        # For small counts, use direct API call to bypass broken otterai library
-        logger.info(f"🔍 Fetching {max_downloads} speeches via direct API...")
-        all_speeches = auth.get_speeches_direct(page_size=max_downloads)
-        
-        logger.info(f"🎙️ Retrieved {len(all_speeches)} speeches from API")
-        
-        if all_speeches and len(all_speeches) > 0:
-            logger.info(f"📝 First speech title: {all_speeches[0].get('title', 'No title')}")
-        
-        console.print(f"✅ Found {len(all_speeches)} speeches in your account")
-        
-        # Stats
-        stats = {'total': len(all_speeches), 'downloaded': 0, 'skipped': 0, 'errors': 0, 'filtered': 0}
-        
-        console.print()
-        console.print(Panel.fit(
-            f"🚀 Processing {len(all_speeches)} speeches\n"
-            f"📁 Format: {format.upper()}\n" 
-            f"⏱️  Sleep: {sleep_seconds}s\n"
-            f"📏 Min length: {min_transcript_length} chars\n"
-            f"📊 Max downloads: {max_downloads or 'All'}",
-            border_style="green"
-        ))
-        
-        # Process speeches directly for small counts
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-            console=console
-        ) as progress:
-            
-            task = progress.add_task("Processing speeches...", total=len(all_speeches))
-            
-            for speech in all_speeches:
-                if max_downloads and stats['downloaded'] >= max_downloads:
-                    console.print(f"🛑 Downloaded maximum limit ({max_downloads} files)")
-                    break
-                
-                title = speech['title'] or 'Untitled'
-                speech_id = speech['speech_id']
-                
-                progress.update(task, description=f"Processing: {title[:40]}...")
-                
-                # Already downloaded?
-                if speech_already_downloaded(speech_id, download_folder, format) and not overwrite:
-                    stats['skipped'] += 1
-                    progress.advance(task)
-                    continue
-                
-                # Too short?
-                transcript = speech.get('transcript', '') or speech.get('summary', '')
-                if transcript and len(transcript) < min_transcript_length:
-                    stats['filtered'] += 1
-                    console.print(f"⏭️ Skipped: {title} (too short - {len(transcript)} chars)")
-                    progress.advance(task)
-                    continue
-                
-                # Download it
-                if download_speech(auth, speech, download_folder, format):
-                    stats['downloaded'] += 1
-                    console.print(f"✅ {title}")
-                else:
-                    stats['errors'] += 1
-                
-                progress.advance(task)
-                
-                if sleep_seconds > 0:
-                    time.sleep(sleep_seconds)
-    
+        # For small counts, a single direct API call covers it
+        logger.info("🔍 Fetching %d speeches via direct API...", max_downloads)
+        batches = iter([auth.get_speeches_direct(page_size=max_downloads)])
     else:
         # For large counts or no limit, use proper batch processing with pagination
         logger.info("🔍 Using batch processing with proper pagination...")
-        
-        # Stats
-        stats = {'total': 0, 'downloaded': 0, 'skipped': 0, 'errors': 0, 'filtered': 0}
-        
-        console.print()
-        console.print(Panel.fit(
-            f"🚀 Processing speeches in batches of 50\n"
-            f"📁 Format: {format.upper()}\n" 
-            f"⏱️  Sleep: {sleep_seconds}s\n"
-            f"📏 Min length: {min_transcript_length} chars\n"
-            f"📊 Max downloads: {max_downloads or 'All'}",
-            border_style="green"
-        ))
-        
-        # Process speeches in batches with proper pagination
-        for batch_num, batch_speeches in enumerate(auth.get_speeches_batch(batch_size=50), 1):
-            stats['total'] += len(batch_speeches)
-            
-            console.print(f"📦 Processing batch {batch_num} ({len(batch_speeches)} speeches)...")
+        batches = auth.get_speeches_batch(batch_size=LISTING_BATCH_SIZE)
+    
+    # Stats
+    stats = {'total': 0, 'downloaded': 0, 'skipped': 0, 'errors': 0, 'filtered': 0}
+    
+    console.print()
+    console.print(Panel.fit(
+        f"🚀 Processing {f'up to {max_downloads}' if max_downloads else 'all'} speeches\n"
+        f"📁 Format: {format.upper()}\n" 
+        f"⏱️  Sleep: {sleep_seconds}s\n"
+        f"🧵 Parallel downloads: {workers}\n"
+        f"📏 Min length: {min_transcript_length} chars\n"
+        f"📊 Max downloads: {max_downloads or 'All'}",
+        border_style="green"
+    ))
+    
+    # One progress bar for the whole run; its total grows as pages bring new work
+    try:
+        with _progress() as progress:
+            task = progress.add_task("Downloading speeches...", total=0)
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TimeRemainingColumn(),
-                console=console
-            ) as progress:
+            for batch_num, batch_speeches in enumerate(batches, 1):
+                stats['total'] += len(batch_speeches)
+                logger.info("📦 Processing batch %d (%d speeches)", batch_num, len(batch_speeches))
                 
-                task = progress.add_task(f"Batch {batch_num}...", total=len(batch_speeches))
-                
-                for speech in batch_speeches:
-                    if max_downloads and stats['downloaded'] >= max_downloads:
-                        console.print(f"🛑 Downloaded maximum limit ({max_downloads} files)")
-                        return stats
-                    
-                    title = speech['title'] or 'Untitled'
-                    speech_id = speech['speech_id']
-                    
-                    progress.update(task, description=f"Processing: {title[:40]}...")
-                    
-                    # Already downloaded?
-                    if speech_already_downloaded(speech_id, download_folder, format) and not overwrite:
-                        stats['skipped'] += 1
-                        progress.advance(task)
-                        continue
-                    
-                    # Too short?
-                    transcript = speech.get('transcript', '') or speech.get('summary', '')
-                    if transcript and len(transcript) < min_transcript_length:
-                        stats['filtered'] += 1
-                        console.print(f"⏭️ Skipped: {title} (too short - {len(transcript)} chars)")
-                        progress.advance(task)
-                        continue
-                    
-                    # Download it
-                    if download_speech(auth, speech, download_folder, format):
-                        stats['downloaded'] += 1
-                        console.print(f"✅ {title}")
-                    else:
-                        stats['errors'] += 1
-                    
-                    progress.advance(task)
-                    
-                    if sleep_seconds > 0:
-                        time.sleep(sleep_seconds)
-            
-            console.print(f"✅ Completed batch {batch_num}: {stats['downloaded']} total downloads so far")
-        
-        console.print(f"🎉 All batches completed! Total speeches processed: {stats['total']}")
+                if _download_speeches(
+                    auth,
+                    batch_speeches,
+                    download_folder=download_folder,
+                    format=format,
+                    overwrite=overwrite,
+                    force=force,
+                    min_transcript_length=min_transcript_length,
+                    limiter=limiter,
+                    max_downloads=max_downloads,
+                    workers=workers,
+                    export_batch_size=export_batch_size,
+                    existing_ids=existing_ids,
+                    updated_at=updated_at,
+                    stats=stats,
+                    progress=progress,
+                    task=task
+                ):
+                    break
+    finally:
+        # Keep what was downloaded before an error or Ctrl-C, too
+        if updated_at != saved_updated_at:
+            save_sidecar(download_folder, updated_at)
+    
+    console.print(f"🎉 All done! Total speeches processed: {stats['total']}")
     
     return stats
@@ -17,8 +17,8 @@ from rich.spinner import Spinner
 from rich.table import Table
 from rich.text import Text
 
-from .auth import OtterAuth
-from .downloader import clean_download_all
+from .auth import POOL_MAXSIZE, OtterAuth, SpeechSummary
+from .downloader import DOWNLOAD_WORKERS, EXPORT_BATCH_SIZE, clean_download_all
 
 console = Console()
 
@@ -36,7 +36,9 @@ def cli():
 @cli.command()
 def login():
     """🔐 Login and list your Otter.ai speeches"""
-    
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
     # Beautiful welcome
     console.print(Panel.fit(
         "[bold blue]🦫 Otter AI Transcript Downloader[/bold blue]\n"
@@ -57,36 +59,40 @@ def login():
     console.print()
     
     # Attempt authentication with beautiful spinner
-    auth = OtterAuth()
-    
-    with console.status("[bold green]Connecting to Otter.ai...[/bold green]", spinner="dots"):
-        try:
-            success = auth.login(username, password)
+    with OtterAuth() as auth:
+        with console.status("[bold green]Connecting to Otter.ai...[/bold green]", spinner="dots"):
+            try:
+                success = auth.login(username, password)
             
-            if success:
-                console.print("✅ [bold green]Successfully authenticated![/bold green]")
-                console.print()
+                if success:
+                    console.print("✅ [bold green]Successfully authenticated![/bold green]")
+                    console.print()
                 
-                # Get and display speeches
-                console.print("[bold cyan]📜 Loading your transcript library...[/bold cyan]")
+                    # Get and display speeches
+                    console.print("[bold cyan]📜 Loading your transcript library...[/bold cyan]")
                 
-                with console.status("[bold blue]Getting speech list...[/bold blue]", spinner="dots"):
-                    speeches = auth.get_all_speeches()
+                    with console.status("[bold blue]Getting speech list...[/bold blue]", spinner="dots"):
+                        # Only request what the table shows - keeps listing pages small -
+                        # plus otid, which paging needs to drop speeches repeated across pages
+                        speeches = [
+                            SpeechSummary.from_dict(speech)
+                            for speech in auth.iter_all_speeches(fields=(*SpeechSummary._fields, 'otid'))
+                        ]
                 
-                if speeches:
-                    _display_speeches(speeches)
-                else:
-                    console.print("[yellow]No speeches found in your account.[/yellow]")
+                    if speeches:
+                        _display_speeches(speeches)
+                    else:
+                        console.print("[yellow]No speeches found in your account.[/yellow]")
                     
-            else:
-                console.print("❌ [bold red]Authentication failed![/bold red]")
-                console.print("[dim]Please check your username and password.[/dim]")
-                sys.exit(1)
+                else:
+                    console.print("❌ [bold red]Authentication failed![/bold red]")
+                    console.print("[dim]Please check your username and password.[/dim]")
+                    sys.exit(1)
                 
-        except Exception as e:
-            console.print(f"💥 [bold red]Error:[/bold red] {str(e)}")
-            console.print("[dim]Please check your internet connection and try again.[/dim]")
-            sys.exit(1)
+            except Exception as e:
+                console.print(f"💥 [bold red]Error:[/bold red] {str(e)}")
+                console.print("[dim]Please check your internet connection and try again.[/dim]")
+                sys.exit(1)
 
 
 def _display_speeches(speeches):
@@ -100,10 +106,12 @@ def _display_speeches(speeches):
     
     for speech in speeches[:20]:  # Show first 20 speeches
         # Format the speech data - adjust based on actual API response
-        title = str(speech.get('title', 'Untitled'))[:37] + "..." if len(str(speech.get('title', 'Untitled'))) > 40 else str(speech.get('title', 'Untitled'))
-        date = str(speech.get('created_at', 'N/A'))[:10]  # Just the date part
-        duration = str(speech.get('duration', 'N/A'))
-        speech_id = str(speech.get('id', 'N/A'))
+        title = speech.title or 'Untitled'
+        if len(title) > 40:
+            title = title[:37] + "..."
+        date = str(speech.created_at or 'N/A')[:10]  # Just the date part
+        duration = str(speech.duration or 'N/A')
+        speech_id = speech.speech_id or 'N/A'
         
         table.add_row(title, date, duration, speech_id)
     
@@ -120,15 +128,17 @@ def _display_speeches(speeches):
 @cli.command()
 @click.option('--folder', '-f', default='~/Dropbox/Otter-Export', help='Download folder (default: ~/Dropbox/Otter-Export)')
 @click.option('--format', '-fmt', default='txt', type=click.Choice(['txt', 'pdf', 'srt', 'docx']), help='File format to download')
-@click.option('--overwrite', '-o', is_flag=True, help='Overwrite existing files')
-@click.option('--sleep', '-s', default=0.5, type=float, help='Seconds to sleep between downloads (default: 0.5)')
+@click.option('--overwrite', '-o', is_flag=True, help='Re-download existing files whose transcript changed on Otter.ai')
+@click.option('--sleep', '-s', default=0.5, type=float, help='Seconds between download requests, shared by all workers (default: 0.5)')
+@click.option('--workers', '-w', default=DOWNLOAD_WORKERS, type=click.IntRange(1, POOL_MAXSIZE, clamp=True), help=f'Parallel downloads (default: {DOWNLOAD_WORKERS}, max: {POOL_MAXSIZE})')
+@click.option('--export-batch', '-b', default=EXPORT_BATCH_SIZE, type=int, help=f'Speeches per export request (default: {EXPORT_BATCH_SIZE})')
 @click.option('--min-length', '-l', default=200, type=int, help='Minimum transcript length to download (default: 200 chars)')
 @click.option('--max-count', '-m', type=int, help='Maximum number of files to download (for testing)')
 @click.option('--force', is_flag=True, help='Force full re-download, ignore existing files')
 @click.option('--username', '-u', help='Otter.ai username/email')
 @click.option('--password', '-p', help='Otter.ai password')
 @click.option('--verbosity', '-v', is_flag=True, help='Enable verbose debugging output')
-def download(folder, format, overwrite, sleep, min_length, max_count, force, username, password, verbosity):
+def download(folder, format, overwrite, sleep, workers, export_batch, min_length, max_count, force, username, password, verbosity):
     """📥 Download all your Otter.ai transcripts"""
     
     # Set up logging level based on verbosity flag
@@ -147,75 +157,84 @@ def download(folder, format, overwrite, sleep, min_length, max_count, force, use
     console.print()
     
     # Get credentials if not provided
-    if not username or not password:
+    if not username:
         console.print("[bold cyan]Please enter your Otter.ai credentials:[/bold cyan]")
-        
-        if not username:
-            username = Prompt.ask("📧 [bold]Username/Email[/bold]")
-        
-        if not password:
-            console.print("🔒 [bold]Password[/bold] (hidden):")
-            password = getpass.getpass("")
-    
-    console.print()
+        username = Prompt.ask("📧 [bold]Username/Email[/bold]")
     
     # Authenticate
-    auth = OtterAuth()
-    
-    with console.status("[bold green]Connecting to Otter.ai...[/bold green]", spinner="dots"):
-        try:
-            success = auth.login(username, password)
+    with OtterAuth() as auth:
+        with console.status("[bold green]Checking saved session...[/bold green]", spinner="dots"):
+            resumed = auth.resume(username)
+        
+        if resumed:
+            console.print("✅ [bold green]Reusing your saved Otter.ai session![/bold green]")
+        else:
+            if not password:
+                console.print("🔒 [bold]Password[/bold] (hidden):")
+                password = getpass.getpass("")
             
-            if not success:
-                console.print("❌ [bold red]Authentication failed![/bold red]")
-                console.print("[dim]Please check your username and password.[/dim]")
-                sys.exit(1)
-                
-            console.print("✅ [bold green]Successfully authenticated![/bold green]")
+            console.print()
             
-        except Exception as e:
-            console.print(f"💥 [bold red]Authentication error:[/bold red] {str(e)}")
-            sys.exit(1)
-    
-    # Show download plan
-    console.print()
-    console.print("[bold cyan]📋 Download Plan:[/bold cyan]")
-    console.print(f"   • Format: {format.upper()}")
-    console.print(f"   • Folder: {folder}")
-    console.print(f"   • Overwrite existing: {'Yes' if overwrite else 'No'}")
-    console.print(f"   • Min transcript length: {min_length} chars")
-    console.print(f"   • Sleep between downloads: {sleep}s")
-    console.print(f"   • Max downloads: {'All speeches' if not max_count else f'{max_count} (testing)'}")
-    if force:
-        console.print(f"   • Force mode: Download all speeches")
-    
-    console.print()
-    
-    # Start download - let it fail properly
-    stats = clean_download_all(
-        auth=auth,
-        folder=folder,
-        format=format,
-        overwrite=overwrite,
-        sleep_seconds=sleep,
-        min_transcript_length=min_length,
-        max_downloads=max_count
-    )
-    
-    # Show summary
-    console.print()
-    console.print(Panel.fit(
-        f"🎉 [bold green]Download Complete![/bold green]\n\n"
-        f"📊 [bold]Summary:[/bold]\n"
-        f"   • Total speeches: {stats['total']}\n"
-        f"   • Downloaded: [green]{stats['downloaded']}[/green]\n"
-        f"   • Skipped: [yellow]{stats['skipped']}[/yellow]\n"
-        f"   • Skipped (too short): [blue]{stats['filtered']}[/blue]\n"
-        f"   • Errors: [red]{stats['errors']}[/red]\n\n"
-        f"📁 Files saved to: [cyan]{folder}[/cyan]",
-        border_style="green",
-        title="Download Summary"
-    ))
+            with console.status("[bold green]Connecting to Otter.ai...[/bold green]", spinner="dots"):
+                try:
+                    success = auth.login(username, password)
+                
+                    if not success:
+                        console.print("❌ [bold red]Authentication failed![/bold red]")
+                        console.print("[dim]Please check your username and password.[/dim]")
+                        sys.exit(1)
+                    
+                    console.print("✅ [bold green]Successfully authenticated![/bold green]")
+                
+                except Exception as e:
+                    console.print(f"💥 [bold red]Authentication error:[/bold red] {str(e)}")
+                    sys.exit(1)
+    
+        # Show download plan
+        console.print()
+        console.print("[bold cyan]📋 Download Plan:[/bold cyan]")
+        console.print(f"   • Format: {format.upper()}")
+        console.print(f"   • Folder: {folder}")
+        console.print(f"   • Overwrite existing: {'Yes (changed transcripts only)' if overwrite else 'No'}")
+        console.print(f"   • Min transcript length: {min_length} chars")
+        console.print(f"   • Time between download requests: {sleep}s")
+        console.print(f"   • Parallel downloads: {workers}")
+        if export_batch > 1:
+            console.print(f"   • Speeches per export request: {export_batch}")
+        console.print(f"   • Max downloads: {'All speeches' if not max_count else f'{max_count} (testing)'}")
+        if force:
+            console.print(f"   • Force mode: Download all speeches")
+    
+        console.print()
+    
+        # Start download - let it fail properly
+        stats = clean_download_all(
+            auth=auth,
+            folder=folder,
+            format=format,
+            overwrite=overwrite,
+            force=force,
+            sleep_seconds=sleep,
+            min_transcript_length=min_length,
+            max_downloads=max_count,
+            workers=workers,
+            export_batch_size=export_batch
+        )
+    
+        # Show summary
+        console.print()
+        console.print(Panel.fit(
+            f"🎉 [bold green]Download Complete![/bold green]\n\n"
+            f"📊 [bold]Summary:[/bold]\n"
+            f"   • Total speeches: {stats['total']}\n"
+            f"   • Downloaded: [green]{stats['downloaded']}[/green]\n"
+            f"   • Skipped: [yellow]{stats['skipped']}[/yellow]\n"
+            f"   • Skipped (too short): [blue]{stats['filtered']}[/blue]\n"
+            f"   • Errors: [red]{stats['errors']}[/red]\n\n"
+            f"📁 Files saved to: [cyan]{folder}[/cyan]",
+            border_style="green",
+            title="Download Summary"
+        ))
 
 
 if __name__ == "__main__":
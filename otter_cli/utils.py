@@ -2,9 +2,18 @@
 Utility functions for the Otter CLI
 """
 
+import functools
 import re
+import threading
+import time
 
+# Anything that isn't a word character, separator, dot or hyphen is dropped from slugs
+_SLUG_UNSAFE = re.compile(r'[^\w\s/|.\-]')
+# Runs of separators and hyphens collapse into a single hyphen
+_SLUG_SEPARATORS = re.compile(r'[\s/_|\-]+')
 
+
+@functools.lru_cache(maxsize=4096)
 def slugify(text: str, max_length: int = 100) -> str:
     """
     Convert text to a safe filename slug - preserves case for human readability
@@ -12,6 +21,7 @@ def slugify(text: str, max_length: int = 100) -> str:
     Keeps alphanumeric, hyphens, and underscores
     Removes/replaces spaces and special characters
     Mac and Dropbox safe
+    Cached, since meeting series repeat the same titles
     """
     if not text:
         return "Untitled"
@@ -19,14 +29,11 @@ def slugify(text: str, max_length: int = 100) -> str:
     # Convert to string and strip whitespace (preserve case)
     slug = str(text).strip()
     
-    # Replace common separators with hyphens
-    slug = re.sub(r'[\s/_\|]+', '-', slug)
-    
     # Remove special characters but keep safe ones (preserve case with \w)
-    slug = re.sub(r'[^\w\-\.]', '', slug)
+    slug = _SLUG_UNSAFE.sub('', slug)
     
-    # Remove multiple consecutive hyphens
-    slug = re.sub(r'\-+', '-', slug)
+    # Replace common separators with hyphens, collapsing repeats in the same pass
+    slug = _SLUG_SEPARATORS.sub('-', slug)
     
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
@@ -40,3 +47,32 @@ def slugify(text: str, max_length: int = 100) -> str:
         return "Untitled"
         
     return slug
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by all download workers
+    
+    Hands out `rate` permits per second on average, with bursts of at most
+    `burst`, no matter how many threads are asking.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a permit is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
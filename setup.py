@@ -38,9 +38,12 @@ setup(
         "click>=8.0.0",
         "rich>=13.0.0", 
         "requests>=2.28.0",
+        "urllib3>=1.26",  # Retry(allowed_methods=...)
+        "PyYAML>=6.0",
     ],
     extras_require={
         "dev": ["pytest", "black", "flake8"],
+        "fast": ["orjson"],
     },
     entry_points={
         "console_scripts": [
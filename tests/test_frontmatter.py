@@ -0,0 +1,90 @@
+"""
+Round-trip checks for the hand-rolled frontmatter emitter
+
+Whatever _yaml_lines writes must read back through yaml.safe_load as the
+exact data it was given, the same guarantee yaml.dump gives.
+"""
+
+import random
+
+import pytest
+import yaml
+
+from otter_cli.downloader import _yaml_lines, generate_frontmatter
+
+# Strings YAML 1.1 likes to reinterpret: booleans, nulls, numbers, dates, indicators
+TRICKY_WORDS = [
+    'yes', 'No', 'ON', 'off', 'null', 'NULL', '~', 'true', 'y', 'n', '1.5', '0x1f', '1e+16', '2023-01-01',
+    '.inf', '-', '- a', '? x', 'a: b', 'a #b', ' a', 'a ', "'q'", '"q"', '<<', '=', 'Untitled',
+    'Weekly sync (team)', 'e1', '_', 'a.b', 'Jean-Luc', "O'Brien",
+]
+ALPHABET = list("abcXYZ 019:-#'\"\\/.,_()&+!?@`|>*%{}[]\n\t") + [
+    'é', '中', '\x85', ' ', '\x7f', '\x01', '﻿', '😀', '\xa0',
+]
+
+
+def _dump(data):
+    return ''.join(f"{line}\n" for line in _yaml_lines(data))
+
+
+def _random_string(rng):
+    return ''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 12)))
+
+
+def _random_value(rng):
+    return rng.choice(TRICKY_WORDS + [_random_string(rng), _random_string(rng), None, True, False, 3, -7])
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_random_frontmatter_round_trips(seed):
+    rng = random.Random(seed)
+    for _ in range(2000):
+        data = {
+            'id': _random_value(rng),
+            'title': _random_value(rng),
+            'speakers': [_random_value(rng) for _ in range(rng.randint(0, 3))],
+            'speaker_analysis': {
+                'total_speakers': rng.randint(0, 3),
+                'speaker_distribution': {
+                    rng.choice(TRICKY_WORDS + [_random_string(rng)]): 1 for _ in range(rng.randint(0, 3))
+                },
+            },
+            'topics': [],
+            'summary': _random_value(rng),
+        }
+        text = _dump(data)
+        assert yaml.safe_load(text) == data, text
+
+
+@pytest.mark.parametrize('value', [1e16, 1.5, -0.0, float('inf')])
+def test_floats_are_left_to_pyyaml(value):
+    with pytest.raises(TypeError):
+        _dump({'value': value})
+
+
+def test_frontmatter_falls_back_to_pyyaml():
+    speech = {'speech_id': 'abc123', 'otid': 'Xy_9', 'title': 1e16, 'hasPhotos': 0}
+    body = generate_frontmatter(speech).split('---\n')[1]
+    assert yaml.safe_load(body)['title'] == 1e16
+
+
+def test_frontmatter_matches_speech():
+    speech = {
+        'speech_id': 'abc123',
+        'otid': 'Xy_9',
+        'created_at': 1700000000,
+        'title': 'Weekly sync: planning',
+        'speakers': [{'speaker_name': 'Alice Smith'}, {'speaker_name': 'Bob'}, {'speaker_name': 'Bob'}],
+        'word_clouds': [{'word': 'roadmap'}, {'word': 'Q3'}],
+        'summary': 'We discussed the plan.',
+        'hasPhotos': 2,
+    }
+    body = generate_frontmatter(speech).split('---\n')[1]
+    data = yaml.safe_load(body)
+    assert data['title'] == 'Weekly sync: planning'
+    assert data['date'] == '2023-11-14T22:13:20Z'
+    assert data['speakers'] == ['Alice Smith', 'Bob', 'Bob']
+    assert data['speaker_analysis'] == {'total_speakers': 3, 'speaker_distribution': {'Alice Smith': 1, 'Bob': 2}}
+    assert data['topics'] == ['roadmap', 'Q3']
+    assert data['has_images'] is True
+    assert data['images_count'] == 2